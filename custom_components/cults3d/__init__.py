@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
+from typing import Final
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import CONF_API_KEY, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
@@ -14,7 +15,7 @@ from .coordinator import Cults3DCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: Final = (Platform.SENSOR,)
 
 type Cults3DConfigEntry = ConfigEntry[Cults3DCoordinator]
 
@@ -24,17 +25,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: Cults3DConfigEntry) -> b
     username = entry.data[CONF_USERNAME]
     api_key = entry.data[CONF_API_KEY]
 
-    coordinator = Cults3DCoordinator(hass, entry, username, api_key)
-
-    # Perform initial data fetch
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryAuthFailed:
-        # Re-raise auth failures to trigger reauth flow
-        raise
-    except Exception as err:
-        _LOGGER.error("Error setting up Cults3D integration: %s", err)
-        raise ConfigEntryNotReady(f"Failed to fetch initial data: {err}") from err
+    # Reuse the coordinator the config flow just validated (it already holds
+    # fresh data), instead of constructing a new one and re-querying the API.
+    pending: dict = hass.data.get(DOMAIN, {}).get("pending", {})
+    coordinator = pending.pop(username.lower(), None)
+
+    if coordinator is not None and coordinator.data is not None:
+        coordinator.attach_config_entry(entry)
+        # Re-publish the cached data so the refresh timer is scheduled
+        coordinator.async_set_updated_data(coordinator.data)
+    else:
+        coordinator = Cults3DCoordinator(hass, entry, username, api_key)
+
+        # Perform initial data fetch
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryAuthFailed:
+            # Re-raise auth failures to trigger reauth flow
+            raise
+        except Exception as err:
+            _LOGGER.error("Error setting up Cults3D integration: %s", err)
+            raise ConfigEntryNotReady(f"Failed to fetch initial data: {err}") from err
 
     # Store coordinator in runtime_data
     entry.runtime_data = coordinator
@@ -49,6 +60,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: Cults3DConfigEntry) -> b
 
 async def async_update_options(hass: HomeAssistant, entry: Cults3DConfigEntry) -> None:
     """Handle options update - reload integration to pick up tracked creations changes."""
+    if entry.state is not ConfigEntryState.LOADED:
+        # Setup (or another reload) is still in flight; reloading now would
+        # race it and trigger duplicate GraphQL fetches. The in-progress
+        # setup reads the updated options when it finishes.
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
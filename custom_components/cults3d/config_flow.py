@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
 import voluptuous as vol
+from aiohttp import ClientSession
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
@@ -16,10 +20,8 @@ from homeassistant.const import CONF_API_KEY, CONF_USERNAME
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from aiohttp import BasicAuth
-
-from .const import CONF_TRACKED_CREATIONS, CULTS3D_GRAPHQL_ENDPOINT, DOMAIN
-from .coordinator import CULTS3D_VALIDATION_QUERY, extract_slug_from_url
+from .const import CONF_TRACKED_CREATIONS, DOMAIN
+from .coordinator import Cults3DCoordinator, extract_slug_from_url
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,28 +32,83 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+REAUTH_CONFIRM_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_API_KEY): str,
+    }
+)
+
+ADD_TRACKED_SCHEMA = vol.Schema(
+    {
+        vol.Required("creation_url"): str,
+    }
+)
 
-async def _validate_credentials(hass, username: str, api_key: str) -> bool:
-    """Validate credentials without needing a full coordinator."""
-    session = async_get_clientsession(hass)
-    auth = BasicAuth(username, api_key)
-
-    try:
-        async with session.post(
-            CULTS3D_GRAPHQL_ENDPOINT,
-            json={"query": CULTS3D_VALIDATION_QUERY, "variables": {"nick": username}},
-            auth=auth,
-            headers={"Content-Type": "application/json"},
-        ) as response:
-            if response.status != 200:
-                return False
-            data = await response.json()
-            if "errors" in data and data["errors"]:
-                return False
-            user_data = data.get("data", {}).get("user")
-            return user_data is not None
-    except Exception:
-        return False
+EMPTY_SCHEMA = vol.Schema({})
+
+# Short-lived cache of validation results so rapid retries with the same
+# (good or bad) credentials don't each cost a GraphQL round-trip. Keyed by
+# username and a digest of the API key (the key itself is never stored).
+_VALIDATION_CACHE: OrderedDict[tuple[str, str], tuple[float, bool]] = OrderedDict()
+_VALIDATION_CACHE_TTL = 30.0
+_VALIDATION_CACHE_MAX = 16
+
+
+def _validation_cache_key(username: str, api_key: str) -> tuple[str, str]:
+    """Build a cache key from the username and a digest of the API key."""
+    return (
+        username.lower(),
+        hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest(),
+    )
+
+
+def _cache_validation_result(key: tuple[str, str], valid: bool) -> None:
+    """Record a validation result, evicting the oldest entries."""
+    _VALIDATION_CACHE[key] = (time.monotonic(), valid)
+    _VALIDATION_CACHE.move_to_end(key)
+    while len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAX:
+        _VALIDATION_CACHE.popitem(last=False)
+
+
+async def _validate_credentials(
+    hass,
+    username: str,
+    api_key: str,
+    entry: ConfigEntry | None = None,
+    session: ClientSession | None = None,
+) -> Cults3DCoordinator | None:
+    """Validate credentials by running a coordinator data update.
+
+    Returns the warm coordinator on success so setup can reuse it (and its
+    already-fetched data) instead of constructing a new one, or None if the
+    credentials are invalid.
+    """
+    cache_key = _validation_cache_key(username, api_key)
+    cached = _VALIDATION_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _VALIDATION_CACHE_TTL:
+        _VALIDATION_CACHE.move_to_end(cache_key)
+        if not cached[1]:
+            return None
+        # Known-good credentials: skip the network round-trip. The returned
+        # coordinator has no data yet, so setup falls back to a first refresh.
+        return Cults3DCoordinator(hass, entry, username, api_key, session=session)
+
+    coordinator = Cults3DCoordinator(hass, entry, username, api_key, session=session)
+    valid = await coordinator.async_validate_credentials()
+    _cache_validation_result(cache_key, valid)
+    return coordinator if valid else None
+
+
+def _stash_pending_coordinator(
+    hass, username_key: str, coordinator: Cults3DCoordinator
+) -> None:
+    """Stash a validated coordinator for async_setup_entry to pick up.
+
+    `username_key` is the already-lowercased username (the entry unique_id).
+    """
+    hass.data.setdefault(DOMAIN, {}).setdefault("pending", {})[
+        username_key
+    ] = coordinator
 
 
 class Cults3DConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -59,6 +116,15 @@ class Cults3DConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    # Client session cached across validation retries within one flow
+    _session: ClientSession | None = None
+
+    def _get_session(self) -> ClientSession:
+        """Get the shared client session, looking it up only once per flow."""
+        if self._session is None:
+            self._session = async_get_clientsession(self.hass)
+        return self._session
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
@@ -73,20 +139,24 @@ class Cults3DConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             username = user_input[CONF_USERNAME].strip()
+            username_key = username.lower()
             api_key = user_input[CONF_API_KEY].strip()
 
             # Check if already configured
-            await self.async_set_unique_id(username.lower())
+            await self.async_set_unique_id(username_key)
             self._abort_if_unique_id_configured()
 
             # Validate credentials
             try:
-                is_valid = await _validate_credentials(self.hass, username, api_key)
+                coordinator = await _validate_credentials(
+                    self.hass, username, api_key, session=self._get_session()
+                )
             except Exception as err:
                 _LOGGER.exception("Unexpected error during validation: %s", err)
                 errors["base"] = "unknown"
             else:
-                if is_valid:
+                if coordinator is not None:
+                    _stash_pending_coordinator(self.hass, username_key, coordinator)
                     return self.async_create_entry(
                         title=f"Cults3D ({username})",
                         data={
@@ -122,12 +192,21 @@ class Cults3DConfigFlow(ConfigFlow, domain=DOMAIN):
             api_key = user_input[CONF_API_KEY].strip()
 
             try:
-                is_valid = await _validate_credentials(self.hass, username, api_key)
+                coordinator = await _validate_credentials(
+                    self.hass,
+                    username,
+                    api_key,
+                    reauth_entry,
+                    session=self._get_session(),
+                )
             except Exception as err:
                 _LOGGER.exception("Unexpected error during reauth: %s", err)
                 errors["base"] = "unknown"
             else:
-                if is_valid:
+                if coordinator is not None:
+                    _stash_pending_coordinator(
+                        self.hass, username.lower(), coordinator
+                    )
                     return self.async_update_reload_and_abort(
                         reauth_entry,
                         data={
@@ -140,11 +219,7 @@ class Cults3DConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_API_KEY): str,
-                }
-            ),
+            data_schema=REAUTH_CONFIRM_SCHEMA,
             errors=errors,
             description_placeholders={
                 "username": reauth_entry.data[CONF_USERNAME],
@@ -158,6 +233,9 @@ class Cults3DOptionsFlow(OptionsFlow):
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
+        # Schema for the tracked-creations form, cached per slug list so
+        # repeated renders don't recompile it
+        self._tracked_schema: tuple[tuple[str, ...], vol.Schema] | None = None
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -185,24 +263,32 @@ class Cults3DOptionsFlow(OptionsFlow):
         if not current_tracked:
             return self.async_show_form(
                 step_id="tracked_creations",
-                data_schema=vol.Schema({}),
+                data_schema=EMPTY_SCHEMA,
                 description_placeholders={"tracked_list": "None"},
             )
 
-        # Create multi-select schema with current tracked creations
+        # Create multi-select schema with current tracked creations,
+        # reusing the compiled schema while the slug list is unchanged
+        cache_key = tuple(current_tracked)
+        if self._tracked_schema is None or self._tracked_schema[0] != cache_key:
+            self._tracked_schema = (
+                cache_key,
+                vol.Schema(
+                    {
+                        vol.Optional(
+                            "tracked_list",
+                            default=current_tracked,
+                        ): vol.All(
+                            vol.Coerce(list),
+                            [vol.In(current_tracked)],
+                        ),
+                    }
+                ),
+            )
+
         return self.async_show_form(
             step_id="tracked_creations",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        "tracked_list",
-                        default=current_tracked,
-                    ): vol.All(
-                        vol.Coerce(list),
-                        [vol.In(current_tracked)],
-                    ),
-                }
-            ),
+            data_schema=self._tracked_schema[1],
             description_placeholders={
                 "tracked_count": str(len(current_tracked)),
             },
@@ -219,28 +305,23 @@ class Cults3DOptionsFlow(OptionsFlow):
 
             if url_or_slug:
                 slug = extract_slug_from_url(url_or_slug)
-                current_tracked = list(
-                    self.config_entry.options.get(CONF_TRACKED_CREATIONS, [])
+                current_tracked = self.config_entry.options.get(
+                    CONF_TRACKED_CREATIONS, ()
                 )
 
-                if slug in current_tracked:
+                if slug in set(current_tracked):
                     errors["base"] = "already_tracked"
                 else:
                     # Add the new slug
-                    current_tracked.append(slug)
                     return self.async_create_entry(
                         title="",
-                        data={CONF_TRACKED_CREATIONS: current_tracked},
+                        data={CONF_TRACKED_CREATIONS: [*current_tracked, slug]},
                     )
             else:
                 errors["base"] = "invalid_url"
 
         return self.async_show_form(
             step_id="add_tracked_creation",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("creation_url"): str,
-                }
-            ),
+            data_schema=ADD_TRACKED_SCHEMA,
             errors=errors,
         )
@@ -2,18 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import math
 import re
+import time
+from base64 import b64encode
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from typing import Any
+from urllib.parse import urlsplit
 
-from aiohttp import BasicAuth, ClientError, ClientResponseError
+from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_TRACKED_CREATIONS,
@@ -24,6 +34,17 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Explicit request timeout; the shared session default (5 min) would let a
+# hung backend stall the whole coordinator and back up other updates
+_TIMEOUT = ClientTimeout(total=30, connect=10, sock_read=20)
+
+# Status codes that indicate a credential problem, looked up in one pass
+# instead of a branch per code
+_AUTH_ERROR_MESSAGES = {
+    401: "Invalid username or API key",
+    403: "Access forbidden - check your API key permissions",
+}
+
 # =============================================================================
 # GraphQL Queries - Corrected based on actual Cults3D schema
 # =============================================================================
@@ -37,23 +58,21 @@ _LOGGER = logging.getLogger(__name__)
 # - Myself has NO salesCount or totalIncome fields
 # =============================================================================
 
-# Query for user profile data only (public data)
-# Using minimal fields first to avoid schema issues
-CULTS3D_USER_QUERY = """
-query GetUserData($nick: String!) {
+# Single query for profile, latest creation, and sales data. The myself
+# block (requires a key with sales scope, may fail) is guarded by @include
+# so the same document serves both paths; GraphQL returns partial data with
+# errors when only that block fails, so one round-trip replaces the three
+# sequential requests previously issued per poll.
+# Sales notes: the API limits salesBatch to 100 per request; a single page
+# is fetched to avoid rate limiting (total count is still accurate via
+# salesBatch.total).
+CULTS3D_MAIN_QUERY = """
+query GetUserData($nick: String!, $limit: Int!, $offset: Int!, $includeSales: Boolean!) {
   user(nick: $nick) {
     nick
     followersCount
     followeesCount
     creationsCount
-  }
-}
-"""
-
-# Separate query for user creations (may have different field requirements)
-CULTS3D_CREATIONS_QUERY = """
-query GetUserCreations($nick: String!) {
-  user(nick: $nick) {
     latestCreation: creations(limit: 1) {
       name
       shortUrl
@@ -64,15 +83,7 @@ query GetUserCreations($nick: String!) {
       publishedAt
     }
   }
-}
-"""
-
-# Separate query for sales data (requires authentication, may fail)
-# Uses pagination (offset) to fetch ALL sales for accurate totals
-# API limits to 100 per request, so we paginate through all pages
-CULTS3D_SALES_QUERY = """
-query GetMySales($limit: Int!, $offset: Int!) {
-  myself {
+  myself @include(if: $includeSales) {
     salesBatch(limit: $limit, offset: $offset) {
       total
       results {
@@ -86,10 +97,17 @@ query GetMySales($limit: Int!, $offset: Int!) {
 }
 """
 
-# Query for a single creation by slug/ID
-CULTS3D_CREATION_QUERY = """
-query GetCreation($slug: String!) {
-  creation(slug: $slug) {
+# Aliased tracked queries are split into groups of this size to stay
+# under server query-complexity limits; chunks are fetched concurrently
+_TRACKED_CHUNK_SIZE = 20
+
+# Tracked-creation metrics change on human timescales, so their last
+# successful parse is reused for this long (two scan intervals) before
+# the batch request is issued again
+_TRACKED_TTL = 2 * DEFAULT_SCAN_INTERVAL.total_seconds()
+
+# Field selection for tracked creations, shared by the aliased batch query
+CREATION_FIELDS = """
     name
     shortUrl
     viewsCount
@@ -100,35 +118,97 @@ query GetCreation($slug: String!) {
     creator {
       nick
     }
-  }
-}
 """
 
-# Validation query
-CULTS3D_VALIDATION_QUERY = """
-query ValidateAuth($nick: String!) {
-  user(nick: $nick) {
-    nick
-  }
-}
-"""
+
+def build_tracked_query(count: int) -> str:
+    """Build a single query fetching `count` creations via aliases.
+
+    One aliased request replaces N round-trips (one per tracked slug).
+    Slugs are passed as variables (s0, s1, ...) and results come back
+    under matching aliases (c0, c1, ...).
+    """
+    params = ", ".join(f"$s{i}: String!" for i in range(count))
+    selections = "\n".join(
+        f"  c{i}: creation(slug: $s{i}) {{{CREATION_FIELDS}  }}"
+        for i in range(count)
+    )
+    return f"query GetTrackedCreations({params}) {{\n{selections}\n}}"
+
+
+def build_auth_header(username: str, api_key: str) -> str:
+    """Build a Basic auth header value for the Cults3D API."""
+    return "Basic " + b64encode(f"{username}:{api_key}".encode()).decode()
+
+
+def _encode_query(
+    query: str | None,
+    variables: dict[str, Any] | None = None,
+    extensions: dict[str, Any] | None = None,
+) -> bytes:
+    """Serialize a GraphQL request body to bytes.
+
+    Bodies for queries whose variables never change are encoded once at
+    coordinator init instead of on every poll. Passing query=None builds a
+    hash-only Automatic Persisted Query body (hash in `extensions`).
+    """
+    payload: dict[str, Any] = {}
+    if query is not None:
+        payload["query"] = query
+    if variables:
+        payload["variables"] = variables
+    if extensions:
+        payload["extensions"] = extensions
+    return json_bytes(payload)
+
+
+# Fallback patterns, compiled once at import, for inputs urlsplit rejects.
+# Full URLs like https://cults3d.com/en/3d-model/gadget/creation-name
+_MODEL_URL_RE = re.compile(r"cults3d\.com/\w+/3d-model/[^/]+/([^/?#]+)")
+# Short URLs like https://cults3d.com/en/creation-slug
+_SHORT_URL_RE = re.compile(r"cults3d\.com/\w+/([^/?#]+)$")
 
 
 def extract_slug_from_url(url_or_slug: str) -> str:
     """Extract the creation slug from a Cults3D URL or return as-is if already a slug."""
-    # Handle full URLs like https://cults3d.com/en/3d-model/gadget/creation-name
-    match = re.search(r"cults3d\.com/\w+/3d-model/[^/]+/([^/?#]+)", url_or_slug)
+    value = url_or_slug.strip()
+    if "cults3d.com" not in value:
+        # Already a slug: no URL machinery needed
+        return value
+
+    # The slug is the last path segment for both the full 3d-model URL and
+    # the short form; urlsplit + rsplit beats regex matching for these
+    # short strings
+    try:
+        path = urlsplit(value).path.rstrip("/")
+    except ValueError:
+        path = ""
+    if path:
+        return path.rsplit("/", 1)[-1]
+
+    match = _MODEL_URL_RE.search(value) or _SHORT_URL_RE.search(value)
     if match:
         return match.group(1)
-    # Handle short URLs like https://cults3d.com/en/creation-slug
-    match = re.search(r"cults3d\.com/\w+/([^/?#]+)$", url_or_slug)
-    if match:
-        return match.group(1)
-    # Assume it's already a slug
-    return url_or_slug.strip()
+    return value
+
 
+def _normalize_tracked_slugs(options: Mapping[str, Any]) -> tuple[str, ...]:
+    """Extract, normalize, and dedupe the tracked slugs from entry options.
+
+    Stored entries may be URL-form or pasted twice; normalizing once here
+    (options only change via an entry reload) keeps every poll from
+    re-running extraction and from fetching the same slug twice.
+    """
+    return tuple(
+        dict.fromkeys(
+            extract_slug_from_url(entry)
+            for entry in options.get(CONF_TRACKED_CREATIONS, ())
+            if entry
+        )
+    )
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CreationData:
     """Data class for a single creation."""
 
@@ -141,7 +221,7 @@ class CreationData:
     published_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrackedCreationData:
     """Data class for a tracked external creation with 30-day metrics."""
 
@@ -166,7 +246,7 @@ class TrackedCreationData:
     # downloads/likes serve as proxy metrics for popularity.
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Cults3DData:
     """Data class for Cults3D coordinator data."""
 
@@ -192,92 +272,312 @@ class Cults3DData:
     tracked_creations: dict[str, TrackedCreationData] = field(default_factory=dict)
 
 
+# Defaults merged under each creation dict so all keys exist, letting a
+# single itemgetter pull every field in one C-level call instead of seven
+# dict.get dispatches per creation
+_CREATION_DEFAULTS = {
+    "name": None,
+    "shortUrl": "",
+    "viewsCount": 0,
+    "downloadsCount": 0,
+    "likesCount": 0,
+    "illustrationImageUrl": None,
+    "publishedAt": None,
+}
+_CREATION_GETTER = itemgetter(
+    "name",
+    "shortUrl",
+    "viewsCount",
+    "downloadsCount",
+    "likesCount",
+    "illustrationImageUrl",
+    "publishedAt",
+)
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO-8601 timestamp from the API, or None if absent/invalid.
+
+    fromisoformat accepts the API's trailing "Z" directly on the Python
+    versions Home Assistant supports, so no normalization copy is made.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
 def _parse_creation(creation_list: list[dict] | None) -> CreationData:
     """Parse a creation from API response."""
     if not creation_list:
         return CreationData()
 
-    creation = creation_list[0]
-    url = creation.get("shortUrl", "")
-    if url and not url.startswith("http"):
-        url = f"https://cults3d.com{url}"
+    name, url, views, downloads, likes, image_url, pub_str = _CREATION_GETTER(
+        _CREATION_DEFAULTS | creation_list[0]
+    )
 
-    image_url = creation.get("illustrationImageUrl")
+    url = url or ""
+    # Slice compare beats startswith for a tiny fixed prefix
+    if url and url[:4] != "http":
+        url = "https://cults3d.com" + url
 
-    # Parse publishedAt
-    published_at = None
-    pub_str = creation.get("publishedAt")
-    if pub_str:
-        try:
-            published_at = datetime.fromisoformat(pub_str.replace("Z", "+00:00"))
-        except (ValueError, TypeError):
-            pass
+    published_at = _parse_datetime(pub_str)
 
     return CreationData(
-        name=creation.get("name"),
+        name=name,
         url=url or None,
         image_url=image_url,
-        views_count=creation.get("viewsCount", 0) or 0,
-        downloads_count=creation.get("downloadsCount", 0) or 0,
-        likes_count=creation.get("likesCount", 0) or 0,
+        views_count=views or 0,
+        downloads_count=downloads or 0,
+        likes_count=likes or 0,
         published_at=published_at,
     )
 
 
-def _parse_single_creation(creation_data: dict | None, slug: str) -> TrackedCreationData:
-    """Parse a single creation from API response for tracked creations."""
+# Tracked-creation fields, extracted in one itemgetter pass over the
+# defaults-merged dict like _CREATION_GETTER above
+_TRACKED_DEFAULTS = {
+    "name": None,
+    "shortUrl": "",
+    "viewsCount": 0,
+    "downloadsCount": 0,
+    "likesCount": 0,
+    "illustrationImageUrl": None,
+    "publishedAt": None,
+    "creator": None,
+}
+_TRACKED_GETTER = itemgetter(
+    "name",
+    "shortUrl",
+    "viewsCount",
+    "downloadsCount",
+    "likesCount",
+    "illustrationImageUrl",
+    "publishedAt",
+    "creator",
+)
+
+
+def _parse_single_creation(
+    creation_data: dict | None, slug: str, now: datetime
+) -> TrackedCreationData:
+    """Parse a single creation from API response for tracked creations.
+
+    `now` is computed once per update cycle by the caller rather than
+    re-read from the clock for every tracked creation.
+    """
     if not creation_data:
         return TrackedCreationData(slug=slug)
 
-    url = creation_data.get("shortUrl", "")
-    if url and not url.startswith("http"):
-        url = f"https://cults3d.com{url}"
-
-    image_url = creation_data.get("illustrationImageUrl")
+    (
+        name,
+        url,
+        views,
+        downloads,
+        likes,
+        image_url,
+        pub_str,
+        creator_data,
+    ) = _TRACKED_GETTER(_TRACKED_DEFAULTS | creation_data)
+
+    url = url or ""
+    if url and url[:4] != "http":
+        url = "https://cults3d.com" + url
 
     # Parse publishedAt and calculate 30-day window
-    published_at = None
     window_start = None
     window_end = None
     is_within_30_days = False
-    pub_str = creation_data.get("publishedAt")
+    published_at = _parse_datetime(pub_str)
+
+    if published_at is not None:
+        window_start = published_at
+        window_end = published_at + timedelta(days=30)
+        is_within_30_days = now <= window_end
 
-    if pub_str:
-        try:
-            published_at = datetime.fromisoformat(pub_str.replace("Z", "+00:00"))
-            window_start = published_at
-            window_end = published_at + timedelta(days=30)
-            now = datetime.now(timezone.utc)
-            is_within_30_days = now <= window_end
-        except (ValueError, TypeError):
-            pass
-
-    creator_data = creation_data.get("creator", {})
     creator = creator_data.get("nick") if creator_data else None
 
     return TrackedCreationData(
         slug=slug,
-        name=creation_data.get("name"),
+        name=name,
         url=url or None,
         image_url=image_url,
         creator=creator,
         published_at=published_at,
-        views_count=creation_data.get("viewsCount", 0) or 0,
-        downloads_count=creation_data.get("downloadsCount", 0) or 0,
-        likes_count=creation_data.get("likesCount", 0) or 0,
+        views_count=views or 0,
+        downloads_count=downloads or 0,
+        likes_count=likes or 0,
         window_start=window_start,
         window_end=window_end,
         is_within_30_days=is_within_30_days,
     )
 
 
+# (hour bucket, boundary) pair for the cached 30-day window start
+_thirty_day_cache: tuple[int, datetime] | None = None
+
+
+def _thirty_days_ago() -> datetime:
+    """Return the 30-day-window boundary, recomputed at most once per hour.
+
+    The monthly sales window doesn't need sub-hour precision, and a stable
+    boundary keeps the derived monthly stats comparable between polls.
+    """
+    global _thirty_day_cache
+    hour = int(time.time()) // 3600
+    cached = _thirty_day_cache
+    if cached is None or cached[0] != hour:
+        boundary = (datetime.now(timezone.utc) - timedelta(days=30)).replace(
+            minute=0, second=0, microsecond=0
+        )
+        _thirty_day_cache = cached = (hour, boundary)
+    return cached[1]
+
+
+def _is_persisted_query_not_found(errors: list[dict]) -> bool:
+    """Check for the APQ miss a server reports before a document is registered."""
+    return any(
+        "PersistedQueryNotFound" in (err.get("message") or "") for err in errors
+    )
+
+
+def _is_sales_scope_error(errors: list[dict]) -> bool:
+    """Check whether every GraphQL error refers to the myself/sales block.
+
+    Distinguishes a missing sales scope (worth excluding from future
+    polls) from transient errors that should not change query shape.
+    """
+    return bool(errors) and all(
+        "myself" in msg or "salesBatch" in msg
+        for err in errors
+        for msg in (err.get("message") or "",)
+    )
+
+
+def _parse_sales(myself_data: dict | None) -> tuple[float, int, float, int, bool]:
+    """Parse sales stats from the myself block. Returns defaults if unavailable.
+
+    Note: Total sales COUNT is accurate (from salesBatch.total).
+    Total EARNINGS is sum of most recent 100 sales only (API rate limit constraint).
+    For full earnings, would need pagination which triggers rate limiting.
+    """
+    if not myself_data:
+        _LOGGER.info("No sales data available (myself block missing or null)")
+        return 0.0, 0, 0.0, 0, False
+
+    thirty_days_ago = _thirty_days_ago()
+
+    sales_batch = myself_data.get("salesBatch") or {}
+
+    # Total count from salesBatch.total (accurate for ALL sales)
+    total_sales_count = sales_batch.get("total", 0) or 0
+
+    # Process sales results (limited to 100 most recent); list comps run in
+    # the C fast path and fsum is a drift-free C loop
+    results = sales_batch.get("results", [])
+    incomes = [
+        float((sale.get("income") or {}).get("value") or 0) for sale in results
+    ]
+    # Rounded to cents here once so sensors can expose the value directly
+    total_sales_amount = round(math.fsum(incomes), 2)
+
+    monthly_incomes = [
+        income
+        for sale, income in zip(results, incomes)
+        if (created_at := _parse_datetime(sale.get("createdAt"))) is not None
+        and created_at >= thirty_days_ago
+    ]
+    monthly_sales_amount = round(math.fsum(monthly_incomes), 2)
+    monthly_sales_count = len(monthly_incomes)
+
+    _LOGGER.debug(
+        "Sales: count=%d (accurate), earnings=%.2f (from %d recent), monthly=%.2f (%d)",
+        total_sales_count,
+        total_sales_amount,
+        len(results),
+        monthly_sales_amount,
+        monthly_sales_count,
+    )
+
+    return (
+        total_sales_amount,
+        total_sales_count,
+        monthly_sales_amount,
+        monthly_sales_count,
+        True,
+    )
+
+
+# User-block fields, extracted in one itemgetter pass like the creation
+# fields above
+_USER_DEFAULTS = {
+    "nick": None,
+    "followersCount": 0,
+    "followeesCount": 0,
+    "creationsCount": 0,
+}
+_USER_GETTER = itemgetter("nick", "followersCount", "followeesCount", "creationsCount")
+
+
+def _make_data_builder(
+    username: str,
+) -> Callable[..., Cults3DData]:
+    """Specialize the per-poll Cults3DData construction for a fixed username.
+
+    The fallback username never changes for a coordinator, so the builder
+    captures it once at init instead of re-reading it from the instance on
+    every update.
+    """
+
+    def build(
+        user_data: dict[str, Any],
+        sales: tuple[float, int, float, int, bool],
+        latest_creation: CreationData,
+        top_downloaded: CreationData,
+        tracked_creations: dict[str, TrackedCreationData],
+    ) -> Cults3DData:
+        (
+            total_sales_amount,
+            total_sales_count,
+            monthly_sales_amount,
+            monthly_sales_count,
+            sales_available,
+        ) = sales
+        nick, followers, following, creations = _USER_GETTER(
+            _USER_DEFAULTS | user_data
+        )
+        return Cults3DData(
+            username=nick or username,
+            followers_count=followers or 0,
+            following_count=following or 0,
+            creations_count=creations or 0,
+            total_sales_amount=total_sales_amount,
+            total_sales_count=total_sales_count,
+            monthly_sales_amount=monthly_sales_amount,
+            monthly_sales_count=monthly_sales_count,
+            sales_data_available=sales_available,
+            latest_creation=latest_creation,
+            top_downloaded=top_downloaded,
+            tracked_creations=tracked_creations,
+        )
+
+    return build
+
+
 class Cults3DCoordinator(DataUpdateCoordinator[Cults3DData]):
     """Cults3D data update coordinator."""
 
-    config_entry: ConfigEntry
+    config_entry: ConfigEntry | None
 
     def __init__(
-        self, hass: HomeAssistant, entry: ConfigEntry, username: str, api_key: str
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry | None,
+        username: str,
+        api_key: str,
+        session: ClientSession | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -285,72 +585,156 @@ class Cults3DCoordinator(DataUpdateCoordinator[Cults3DData]):
             _LOGGER,
             name=DOMAIN,
             update_interval=DEFAULT_SCAN_INTERVAL,
+            # The data classes compare by value, so unchanged polls skip
+            # listener notification and the resulting sensor state writes
+            always_update=False,
         )
         self.config_entry = entry
         self._username = username
         self._api_key = api_key
-        self._session = async_get_clientsession(hass)
+        self._session = session if session is not None else async_get_clientsession(hass)
+        # Credentials never change for the lifetime of a coordinator, so the
+        # request headers are computed once instead of per request.
+        # Accept-Encoding lets the server gzip the response; the shared
+        # session decompresses transparently.
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": build_auth_header(username, api_key),
+            "Accept-Encoding": "gzip, deflate, br",
+        }
+        # Bodies of the recurring main query are likewise fixed per
+        # coordinator; serialize both @include variants once instead of on
+        # every poll. _include_sales drops to False only when the API
+        # reports the sales scope itself as unavailable (see
+        # _is_sales_scope_error); transient errors leave it untouched.
+        self._include_sales = True
+        # Automatic Persisted Queries: after the document is registered
+        # server-side, polls send only its sha256 instead of the ~1 KB text.
+        apq_extensions = {
+            "persistedQuery": {
+                "version": 1,
+                "sha256Hash": hashlib.sha256(
+                    CULTS3D_MAIN_QUERY.encode()
+                ).hexdigest(),
+            }
+        }
+        main_variables = {
+            include: {
+                "nick": username,
+                "limit": 100,
+                "offset": 0,
+                "includeSales": include,
+            }
+            for include in (True, False)
+        }
+        # Full-text bodies carry the hash too, so a supporting server
+        # registers the document when they're sent
+        self._main_query_bodies = {
+            include: _encode_query(
+                CULTS3D_MAIN_QUERY, main_variables[include], apq_extensions
+            )
+            for include in (True, False)
+        }
+        self._main_apq_bodies = {
+            include: _encode_query(None, main_variables[include], apq_extensions)
+            for include in (True, False)
+        }
+        # None = untested; set on the first poll and remembered after
+        self._apq_supported: bool | None = None
+        # Cap concurrent requests to the API so a large tracked list can't
+        # burst enough simultaneous POSTs to trip rate limits and stall
+        # every request behind 429 retries
+        self._request_sem = asyncio.Semaphore(8)
+        # In-flight requests keyed by encoded body; a concurrent caller
+        # issuing an identical request awaits the first one's result
+        # instead of duplicating the round-trip
+        self._inflight: dict[bytes, asyncio.Task[dict[str, Any]]] = {}
+        # (monotonic timestamp, data) of the last successful fetch, served
+        # on transient failures while still fresh enough
+        self._last_good: tuple[float, Cults3DData] | None = None
+        # (monotonic timestamp, parsed result) of the last successful
+        # tracked-creations fetch, reused within _TRACKED_TTL
+        self._tracked_cache: tuple[float, dict[str, TrackedCreationData]] | None = None
+        # Per-chunk (slugs, query, body) for the batched tracked-creations
+        # requests; rebuilt only when the tracked slugs change.
+        self._tracked_query_cache: dict[
+            str, tuple[tuple[str, ...], str, bytes]
+        ] = {}
+        # Per-query (ETag, parsed result) pairs. If the server honors
+        # If-None-Match, a 304 lets us reuse the parsed response without
+        # re-downloading or re-parsing the body.
+        self._response_cache: dict[str, tuple[str, dict[str, Any]]] = {}
+        # Data construction specialized for this user at init time
+        self._build_data = _make_data_builder(username)
+        # Tracked slugs are fixed until an options change reloads the entry,
+        # so normalize and snapshot them once instead of re-reading options
+        # every poll.
+        self.tracked_creation_slugs: tuple[str, ...] = (
+            _normalize_tracked_slugs(entry.options) if entry is not None else ()
+        )
 
-    def _get_auth(self) -> BasicAuth:
-        """Get HTTP Basic Auth for API requests."""
-        return BasicAuth(self._username, self._api_key)
+    def attach_config_entry(self, entry: ConfigEntry) -> None:
+        """Attach an entry created after a flow-time validation.
 
-    @property
-    def tracked_creation_slugs(self) -> list[str]:
-        """Get list of tracked creation slugs from options."""
-        return self.config_entry.options.get(CONF_TRACKED_CREATIONS, [])
+        Coordinators built during the initial config flow have no entry yet;
+        setup attaches it here so entry-derived state is recomputed.
+        """
+        self.config_entry = entry
+        self.tracked_creation_slugs = _normalize_tracked_slugs(entry.options)
 
     async def _async_execute_query(
         self,
         query: str,
         variables: dict[str, Any] | None = None,
         raise_on_error: bool = True,
+        body: bytes | None = None,
+        cache_key: str | None = None,
     ) -> dict[str, Any]:
-        """Execute a GraphQL query against the Cults3D API."""
-        payload = {"query": query}
-        if variables:
-            payload["variables"] = variables
+        """Execute a GraphQL query against the Cults3D API.
+
+        Callers with invariant variables pass a pre-encoded `body` to skip
+        re-serializing the payload on every call; otherwise the body is
+        built from `query` and `variables`. With a `cache_key`, the last
+        response's ETag is sent as If-None-Match and a 304 answers from the
+        parsed-response cache.
+        """
+        if body is None:
+            body = _encode_query(query, variables)
+
+        headers = self._headers
+        cached_response: tuple[str, dict[str, Any]] | None = None
+        if cache_key is not None:
+            cached_response = self._response_cache.get(cache_key)
+            if cached_response is not None:
+                headers = {**headers, "If-None-Match": cached_response[0]}
 
         # Log query for debugging (first line only to identify which query)
         query_first_line = query.strip().split("\n")[0]
         _LOGGER.debug("Executing GraphQL query: %s", query_first_line)
 
         try:
-            async with self._session.post(
-                CULTS3D_GRAPHQL_ENDPOINT,
-                json=payload,
-                auth=self._get_auth(),
-                headers={"Content-Type": "application/json"},
-            ) as response:
-                _LOGGER.debug("Response status: %s", response.status)
-
-                if response.status == 401:
-                    raise ConfigEntryAuthFailed("Invalid username or API key")
-                if response.status == 403:
-                    raise ConfigEntryAuthFailed(
-                        "Access forbidden - check your API key permissions"
-                    )
-                if response.status != 200:
-                    if raise_on_error:
-                        raise UpdateFailed(
-                            f"API request failed with status {response.status}"
-                        )
-                    return {"data": None, "errors": [{"message": f"HTTP {response.status}"}]}
-
-                data = await response.json()
-                _LOGGER.debug("Response data keys: %s", list(data.keys()) if data else "None")
-
-                if "errors" in data and data["errors"]:
-                    error_messages = [
-                        err.get("message", "Unknown error") for err in data["errors"]
-                    ]
-                    error_str = "; ".join(error_messages)
-                    _LOGGER.warning("GraphQL errors for query %s: %s", query_first_line, error_str)
-                    if raise_on_error:
-                        raise UpdateFailed(f"GraphQL error: {error_str}")
-
-                return data
-
+            if (inflight := self._inflight.get(body)) is not None:
+                # Identical request already on the wire; share its result.
+                # shield keeps this caller's cancellation from killing the
+                # request the original caller is still waiting on.
+                _LOGGER.debug("Coalescing duplicate in-flight request")
+                return await asyncio.shield(inflight)
+
+            task = asyncio.create_task(
+                self._post_and_parse(
+                    body,
+                    headers,
+                    query_first_line,
+                    raise_on_error,
+                    cached_response,
+                    cache_key,
+                )
+            )
+            self._inflight[body] = task
+            try:
+                return await task
+            finally:
+                self._inflight.pop(body, None)
         except ClientResponseError as err:
             if err.status in (401, 403):
                 raise ConfigEntryAuthFailed(
@@ -359,192 +743,340 @@ class Cults3DCoordinator(DataUpdateCoordinator[Cults3DData]):
             if raise_on_error:
                 raise UpdateFailed(f"API request failed: {err}") from err
             return {"data": None, "errors": [{"message": str(err)}]}
-        except ClientError as err:
+        except (ClientError, TimeoutError) as err:
             if raise_on_error:
                 raise UpdateFailed(f"Connection error: {err}") from err
             return {"data": None, "errors": [{"message": str(err)}]}
 
+    async def _post_and_parse(
+        self,
+        body: bytes,
+        headers: dict[str, str],
+        query_first_line: str,
+        raise_on_error: bool,
+        cached_response: tuple[str, dict[str, Any]] | None,
+        cache_key: str | None,
+    ) -> dict[str, Any]:
+        """POST one GraphQL request and parse the response.
+
+        A 429 is retried once after honoring Retry-After; sleeping between
+        attempts happens with the response released, so the connection goes
+        back to the pool while we wait.
+        """
+        async with self._request_sem:
+            for attempt in (0, 1):
+                async with self._session.post(
+                    CULTS3D_GRAPHQL_ENDPOINT,
+                    data=body,
+                    headers=headers,
+                    timeout=_TIMEOUT,
+                ) as response:
+                    status = response.status
+                    _LOGGER.debug("Response status: %s", status)
+
+                    if status != 429 or attempt:
+                        return self._parse_response_payload(
+                            status,
+                            await response.read() if status == 200 else b"",
+                            response.headers.get("ETag"),
+                            query_first_line,
+                            raise_on_error,
+                            cached_response,
+                            cache_key,
+                        )
+
+                try:
+                    retry_after = min(
+                        float(response.headers.get("Retry-After", "")), 30.0
+                    )
+                except ValueError:
+                    retry_after = 1.0
+                _LOGGER.debug("Rate limited; retrying in %.0fs", retry_after)
+                await asyncio.sleep(retry_after)
+
+        raise UpdateFailed("API request failed with status 429")
+
+    def _parse_response_payload(
+        self,
+        status: int,
+        raw: bytes,
+        etag: str | None,
+        query_first_line: str,
+        raise_on_error: bool,
+        cached_response: tuple[str, dict[str, Any]] | None,
+        cache_key: str | None,
+    ) -> dict[str, Any]:
+        """Turn one HTTP response into a GraphQL result dict (or raise)."""
+        if status == 304 and cached_response is not None:
+            _LOGGER.debug("Not modified; reusing cached response")
+            return cached_response[1]
+        if (auth_error := _AUTH_ERROR_MESSAGES.get(status)) is not None:
+            raise ConfigEntryAuthFailed(auth_error)
+        if status != 200:
+            if raise_on_error:
+                raise UpdateFailed(
+                    f"API request failed with status {status}"
+                )
+            return {"data": None, "errors": [{"message": f"HTTP {status}"}]}
+
+        data = json_loads(raw)
+        _LOGGER.debug("Response data keys: %s", list(data.keys()) if data else "None")
+
+        if "errors" in data and data["errors"]:
+            error_messages = [
+                err.get("message", "Unknown error") for err in data["errors"]
+            ]
+            error_str = "; ".join(error_messages)
+            _LOGGER.warning("GraphQL errors for query %s: %s", query_first_line, error_str)
+            if raise_on_error:
+                raise UpdateFailed(f"GraphQL error: {error_str}")
+        elif cache_key is not None and etag:
+            self._response_cache[cache_key] = (etag, data)
+
+        return data
+
     async def async_validate_credentials(self) -> bool:
-        """Validate the provided credentials by running a test query."""
+        """Validate the provided credentials by running a full data update.
+
+        On success the fetched data is cached on the coordinator, so setup
+        does not need to repeat the same GraphQL round-trip moments later.
+        """
         try:
-            result = await self._async_execute_query(
-                CULTS3D_VALIDATION_QUERY,
-                {"nick": self._username},
-            )
-            user_data = result.get("data", {}).get("user")
-            if user_data is None:
-                _LOGGER.error("User '%s' not found on Cults3D", self._username)
-                return False
-            return True
+            data = await self._async_update_data()
         except ConfigEntryAuthFailed:
             return False
         except UpdateFailed as err:
             _LOGGER.error("Validation failed: %s", err)
             return False
 
-    async def _fetch_tracked_creation(self, slug: str) -> TrackedCreationData:
-        """Fetch data for a single tracked creation."""
-        try:
-            result = await self._async_execute_query(
-                CULTS3D_CREATION_QUERY,
-                {"slug": slug},
-            )
-            creation_data = result.get("data", {}).get("creation")
-            return _parse_single_creation(creation_data, slug)
-        except UpdateFailed as err:
-            _LOGGER.warning("Failed to fetch tracked creation %s: %s", slug, err)
-            return TrackedCreationData(slug=slug)
+        self.async_set_updated_data(data)
+        return True
 
-    async def _fetch_sales_data(self) -> tuple[float, int, float, int, bool]:
-        """Fetch sales data from myself query. Returns defaults if unavailable.
+    def _get_tracked_query(
+        self, slugs: tuple[str, ...], cache_key: str
+    ) -> tuple[str, bytes]:
+        """Get the (query, body) pair for one batched tracked-query chunk."""
+        cached = self._tracked_query_cache.get(cache_key)
+        if cached is not None and cached[0] == slugs:
+            return cached[1], cached[2]
 
-        Note: Total sales COUNT is accurate (from salesBatch.total).
-        Total EARNINGS is sum of most recent 100 sales only (API rate limit constraint).
-        For full earnings, would need pagination which triggers rate limiting.
+        query = build_tracked_query(len(slugs))
+        body = _encode_query(
+            query, {f"s{i}": slug for i, slug in enumerate(slugs)}
+        )
+        self._tracked_query_cache[cache_key] = (slugs, query, body)
+        # The slug set changed, so any cached ETag response is for a
+        # different request body
+        self._response_cache.pop(cache_key, None)
+        return query, body
+
+    async def _fetch_tracked_chunk(
+        self, slugs: tuple[str, ...], cache_key: str, now: datetime
+    ) -> dict[str, TrackedCreationData] | None:
+        """Fetch one chunk of tracked creations in a single aliased request.
+
+        Returns None on failure so the caller can fall back without
+        caching the empty placeholder data.
         """
-        total_sales_amount = 0.0
-        total_sales_count = 0
-        monthly_sales_amount = 0.0
-        monthly_sales_count = 0
-        thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
-
+        query, body = self._get_tracked_query(slugs, cache_key)
         try:
-            # Fetch sales data - single request to avoid rate limiting
             result = await self._async_execute_query(
-                CULTS3D_SALES_QUERY,
-                {"limit": 100, "offset": 0},
+                query,
                 raise_on_error=False,
+                body=body,
+                cache_key=cache_key,
             )
+        except UpdateFailed as err:
+            _LOGGER.warning("Failed to fetch tracked creations: %s", err)
+            return None
 
-            if "errors" in result and result["errors"]:
-                _LOGGER.warning(
-                    "Sales data unavailable: %s",
-                    "; ".join(e.get("message", "") for e in result["errors"])
-                )
-                return 0.0, 0, 0.0, 0, False
-
-            myself_data = result.get("data", {}).get("myself")
-            if not myself_data:
-                _LOGGER.info("No sales data available (myself query returned null)")
-                return 0.0, 0, 0.0, 0, False
-
-            sales_batch = myself_data.get("salesBatch", {})
-
-            # Total count from salesBatch.total (accurate for ALL sales)
-            total_sales_count = sales_batch.get("total", 0) or 0
-
-            # Process sales results (limited to 100 most recent)
-            results = sales_batch.get("results", [])
-            for sale in results:
-                income_data = sale.get("income", {})
-                income_value = float(income_data.get("value", 0) or 0) if income_data else 0.0
-                total_sales_amount += income_value
-
-                # Check if sale is within last 30 days for monthly stats
-                created_at_str = sale.get("createdAt")
-                if created_at_str:
-                    try:
-                        created_at = datetime.fromisoformat(
-                            created_at_str.replace("Z", "+00:00")
-                        )
-                        if created_at >= thirty_days_ago:
-                            monthly_sales_amount += income_value
-                            monthly_sales_count += 1
-                    except (ValueError, TypeError):
-                        pass
-
-            _LOGGER.debug(
-                "Sales: count=%d (accurate), earnings=%.2f (from %d recent), monthly=%.2f (%d)",
-                total_sales_count,
-                total_sales_amount,
-                len(results),
-                monthly_sales_amount,
-                monthly_sales_count,
-            )
-
-            return total_sales_amount, total_sales_count, monthly_sales_amount, monthly_sales_count, True
-
-        except Exception as err:
-            _LOGGER.warning("Failed to fetch sales data: %s", err)
-            return 0.0, 0, 0.0, 0, False
+        data = result.get("data") or {}
+        return {
+            slug: _parse_single_creation(data.get(f"c{i}"), slug, now)
+            for i, slug in enumerate(slugs)
+        }
 
-    async def _fetch_creations_data(self) -> tuple[CreationData, CreationData]:
-        """Fetch user creations data. Returns defaults if unavailable."""
-        try:
+    async def _fetch_tracked_creations(
+        self, slugs: tuple[str, ...]
+    ) -> dict[str, TrackedCreationData]:
+        """Fetch all tracked creations via aliased batch requests.
+
+        Tracked metrics change slowly, so the last successful result is
+        reused within _TRACKED_TTL and the request skipped entirely.
+        Otherwise slugs are grouped into chunks of _TRACKED_CHUNK_SIZE
+        (one aliased request each, fetched concurrently) to keep any
+        single query under server complexity limits; the common case is
+        a single chunk.
+        """
+        if not slugs:
+            return {}
+
+        mono = time.monotonic()
+        cached = self._tracked_cache
+        if (
+            cached is not None
+            and mono - cached[0] < _TRACKED_TTL
+            and tuple(cached[1]) == slugs
+        ):
+            return cached[1]
+
+        # One clock read and tz-object allocation per cycle, shared by
+        # every tracked creation's 30-day-window check
+        now = datetime.now(timezone.utc)
+
+        chunks = [
+            slugs[i : i + _TRACKED_CHUNK_SIZE]
+            for i in range(0, len(slugs), _TRACKED_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._fetch_tracked_chunk(chunk, f"tracked{i}", now)
+                for i, chunk in enumerate(chunks)
+            )
+        )
+        merged: dict[str, TrackedCreationData] = {}
+        failed = False
+        for chunk, chunk_result in zip(chunks, results):
+            if chunk_result is None:
+                failed = True
+                merged.update(
+                    (slug, TrackedCreationData(slug=slug)) for slug in chunk
+                )
+            else:
+                merged.update(chunk_result)
+        if not failed:
+            self._tracked_cache = (mono, merged)
+        return merged
+
+    async def _execute_main_query(self) -> dict[str, Any]:
+        """Run the main query, preferring the hash-only persisted form.
+
+        Automatic Persisted Queries replace the ~1 KB document with its
+        sha256 once the server knows it. On PersistedQueryNotFound the full
+        text (carrying the hash) is sent to register it; a server that
+        doesn't speak APQ at all is detected on the first poll and the
+        hash-only probe is skipped from then on.
+        """
+        include = self._include_sales
+        if self._apq_supported is not False:
             result = await self._async_execute_query(
-                CULTS3D_CREATIONS_QUERY,
-                {"nick": self._username},
+                CULTS3D_MAIN_QUERY,
                 raise_on_error=False,
+                body=self._main_apq_bodies[include],
+                cache_key="main",
             )
+            if (result.get("data") or {}).get("user") is not None:
+                self._apq_supported = True
+                return result
+            if not _is_persisted_query_not_found(result.get("errors") or []):
+                if self._apq_supported is None:
+                    # First contact and not an APQ miss: assume unsupported
+                    # and stop paying for the probe
+                    _LOGGER.debug("Server does not support persisted queries")
+                    self._apq_supported = False
+                else:
+                    # Known-good APQ server returned a real error
+                    return result
+
+        return await self._async_execute_query(
+            CULTS3D_MAIN_QUERY,
+            raise_on_error=False,
+            body=self._main_query_bodies[include],
+            cache_key="main",
+        )
+
+    async def _async_update_data(self) -> Cults3DData:
+        """Fetch data, serving last-known-good on transient failures.
 
-            if "errors" in result and result["errors"]:
+        If a fetch fails while the previous result is younger than two
+        scan intervals, sensors keep the stale data instead of going
+        unavailable; older failures propagate normally.
+        """
+        try:
+            data = await self._do_fetch()
+        except ConfigEntryAuthFailed:
+            raise
+        except UpdateFailed as err:
+            last = self._last_good
+            if last is not None and (
+                time.monotonic() - last[0]
+                < 2 * DEFAULT_SCAN_INTERVAL.total_seconds()
+            ):
                 _LOGGER.warning(
-                    "Creations data unavailable: %s",
-                    "; ".join(e.get("message", "") for e in result["errors"])
+                    "Update failed (%s); serving last-known-good data", err
                 )
-                return CreationData(), CreationData()
-
-            user_data = result.get("data", {}).get("user")
-            if not user_data:
-                return CreationData(), CreationData()
-
-            latest = _parse_creation(user_data.get("latestCreation"))
-            # For now, use the same as latest since we removed sorting
-            top_downloaded = latest
+                return last[1]
+            raise
 
-            return latest, top_downloaded
+        self._last_good = (time.monotonic(), data)
+        return data
 
-        except Exception as err:
-            _LOGGER.warning("Failed to fetch creations data: %s", err)
-            return CreationData(), CreationData()
+    async def _do_fetch(self) -> Cults3DData:
+        """Fetch data from Cults3D API.
 
-    async def _async_update_data(self) -> Cults3DData:
-        """Fetch data from Cults3D API."""
+        Profile, latest creation, and sales come back in one request; a
+        failing myself block yields partial data plus errors, so sales
+        simply report unavailable without a fallback round-trip. The
+        tracked-creations batch needs nothing from the main response, so
+        both requests run concurrently and the poll costs one round-trip
+        of latency instead of two.
+        """
         _LOGGER.debug("Starting Cults3D data update for user: %s", self._username)
 
-        # Fetch main user data (this must succeed)
-        result = await self._async_execute_query(
-            CULTS3D_USER_QUERY,
-            {"nick": self._username},
+        result, tracked_creations = await asyncio.gather(
+            self._execute_main_query(),
+            self._fetch_tracked_creations(self.tracked_creation_slugs),
+            return_exceptions=True,
         )
+        if isinstance(result, BaseException):
+            raise result
+        if isinstance(tracked_creations, BaseException):
+            # Isolate tracked failures: the main data is still usable
+            _LOGGER.warning(
+                "Failed to fetch tracked creations: %s", tracked_creations
+            )
+            tracked_creations = {
+                slug: TrackedCreationData(slug=slug)
+                for slug in self.tracked_creation_slugs
+            }
 
-        data = result.get("data", {})
+        errors = result.get("errors") or []
+        data = result.get("data") or {}
         user_data = data.get("user")
 
         if user_data is None:
+            if errors:
+                raise UpdateFailed(
+                    "GraphQL error: "
+                    + "; ".join(e.get("message", "Unknown error") for e in errors)
+                )
             raise UpdateFailed(f"User '{self._username}' not found")
 
+        if errors:
+            # Partial response: the user block resolved, so only optional
+            # blocks (typically myself/sales) failed
+            _LOGGER.warning(
+                "Partial GraphQL errors (sales data may be unavailable): %s",
+                "; ".join(e.get("message", "Unknown error") for e in errors),
+            )
+            if self._include_sales and _is_sales_scope_error(errors):
+                # The sales scope itself is unavailable for this API key;
+                # stop requesting the myself block until the entry reloads
+                _LOGGER.info(
+                    "Excluding sales from future polls (scope unavailable)"
+                )
+                self._include_sales = False
+                # The request body changes, so the cached ETag is stale
+                self._response_cache.pop("main", None)
+
         _LOGGER.debug("User data fetched successfully: %s", user_data.get("nick"))
 
-        # Fetch creations data separately (optional - may fail)
-        latest_creation, top_downloaded = await self._fetch_creations_data()
+        latest_creation = _parse_creation(user_data.get("latestCreation"))
+        # For now, use the same as latest since we removed sorting
+        top_downloaded = latest_creation
 
-        # Fetch sales data separately (optional - may fail)
-        (
-            total_sales_amount,
-            total_sales_count,
-            monthly_sales_amount,
-            monthly_sales_count,
-            sales_available,
-        ) = await self._fetch_sales_data()
-
-        # Fetch tracked creations
-        tracked_creations: dict[str, TrackedCreationData] = {}
-        for slug in self.tracked_creation_slugs:
-            tracked_data = await self._fetch_tracked_creation(slug)
-            tracked_creations[slug] = tracked_data
+        sales = _parse_sales(data.get("myself"))
 
-        return Cults3DData(
-            username=user_data.get("nick", self._username),
-            followers_count=user_data.get("followersCount", 0) or 0,
-            following_count=user_data.get("followeesCount", 0) or 0,
-            creations_count=user_data.get("creationsCount", 0) or 0,
-            total_sales_amount=total_sales_amount,
-            total_sales_count=total_sales_count,
-            monthly_sales_amount=monthly_sales_amount,
-            monthly_sales_count=monthly_sales_count,
-            sales_data_available=sales_available,
-            latest_creation=latest_creation,
-            top_downloaded=top_downloaded,
-            tracked_creations=tracked_creations,
+        return self._build_data(
+            user_data, sales, latest_creation, top_downloaded, tracked_creations
         )
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -12,7 +15,7 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -31,10 +34,10 @@ from .const import (
     SENSOR_TOTAL_SALES_AMOUNT,
     SENSOR_TOTAL_SALES_COUNT,
 )
-from .coordinator import Cults3DCoordinator, Cults3DData, TrackedCreationData
+from .coordinator import CreationData, Cults3DCoordinator, Cults3DData
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Cults3DSensorEntityDescription(SensorEntityDescription):
     """Describes a Cults3D sensor entity."""
 
@@ -42,6 +45,53 @@ class Cults3DSensorEntityDescription(SensorEntityDescription):
     extra_attrs_fn: Callable[[Cults3DData], dict[str, Any]] | None = None
 
 
+@lru_cache(maxsize=16)
+def _creation_attrs(creation: CreationData) -> dict[str, Any]:
+    """Build the attribute dict for one featured creation, memoized.
+
+    CreationData is frozen (hashable, value-compared), so the same
+    creation never pays the dict build or isoformat twice — including
+    across sensors when latest and top-downloaded are the same object.
+    Callers must treat the returned dict as read-only.
+    """
+    return {
+        "url": creation.url,
+        "image_url": creation.image_url,
+        "views": creation.views_count,
+        "downloads": creation.downloads_count,
+        "likes": creation.likes_count,
+        "published_at": creation.published_at.isoformat()
+        if creation.published_at
+        else None,
+    }
+
+
+# Shared placeholder attrs for a slug the API didn't return; one module-
+# level dict instead of an allocation per refresh while the gap lasts.
+# Treated as read-only by all consumers.
+_MISSING_ATTRS = {"error": "Creation not found"}
+
+# Static documentation attribute shared by every tracked-creation sensor;
+# one module-level string instead of a literal inside each attrs build
+_TRACKED_NOTE = (
+    "Sales data for non-owned creations is NOT available via API. "
+    "Downloads/likes shown are cumulative totals and serve as proxy "
+    "metrics for popularity. The 30-day window indicates the first "
+    "30 days post-release period, but metrics are NOT filtered to "
+    "that window due to API limitations."
+)
+
+
+def _creation_attrs_fn(creation_attr: str) -> Callable[[Cults3DData], dict[str, Any]]:
+    """Build the extra-attributes function for a featured-creation sensor."""
+    getter = attrgetter(creation_attr)
+
+    def attrs_fn(data: Cults3DData) -> dict[str, Any]:
+        return _creation_attrs(getter(data))
+
+    return attrs_fn
+
+
 # Sensors for own profile and creations
 SENSOR_DESCRIPTIONS: tuple[Cults3DSensorEntityDescription, ...] = (
     # Profile stats
@@ -51,7 +101,7 @@ SENSOR_DESCRIPTIONS: tuple[Cults3DSensorEntityDescription, ...] = (
         icon="mdi:account-multiple",
         native_unit_of_measurement="followers",
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda data: data.followers_count,
+        value_fn=attrgetter("followers_count"),
     ),
     Cults3DSensorEntityDescription(
         key=SENSOR_FOLLOWING,
@@ -59,7 +109,7 @@ SENSOR_DESCRIPTIONS: tuple[Cults3DSensorEntityDescription, ...] = (
         icon="mdi:account-multiple-outline",
         native_unit_of_measurement="following",
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda data: data.following_count,
+        value_fn=attrgetter("following_count"),
     ),
     Cults3DSensorEntityDescription(
         key=SENSOR_CREATIONS,
@@ -67,7 +117,7 @@ SENSOR_DESCRIPTIONS: tuple[Cults3DSensorEntityDescription, ...] = (
         icon="mdi:cube-outline",
         native_unit_of_measurement="creations",
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda data: data.creations_count,
+        value_fn=attrgetter("creations_count"),
     ),
     # Sales stats (own sales via myself query)
     Cults3DSensorEntityDescription(
@@ -77,7 +127,7 @@ SENSOR_DESCRIPTIONS: tuple[Cults3DSensorEntityDescription, ...] = (
         native_unit_of_measurement=CURRENCY_EUR,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda data: round(data.total_sales_amount, 2),
+        value_fn=attrgetter("total_sales_amount"),
     ),
     Cults3DSensorEntityDescription(
         key=SENSOR_TOTAL_SALES_COUNT,
@@ -85,7 +135,7 @@ SENSOR_DESCRIPTIONS: tuple[Cults3DSensorEntityDescription, ...] = (
         icon="mdi:cart",
         native_unit_of_measurement="sales",
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda data: data.total_sales_count,
+        value_fn=attrgetter("total_sales_count"),
     ),
     Cults3DSensorEntityDescription(
         key=SENSOR_MONTHLY_SALES_AMOUNT,
@@ -94,7 +144,7 @@ SENSOR_DESCRIPTIONS: tuple[Cults3DSensorEntityDescription, ...] = (
         native_unit_of_measurement=CURRENCY_EUR,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda data: round(data.monthly_sales_amount, 2),
+        value_fn=attrgetter("monthly_sales_amount"),
     ),
     Cults3DSensorEntityDescription(
         key=SENSOR_MONTHLY_SALES_COUNT,
@@ -102,40 +152,22 @@ SENSOR_DESCRIPTIONS: tuple[Cults3DSensorEntityDescription, ...] = (
         icon="mdi:calendar-check",
         native_unit_of_measurement="sales",
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda data: data.monthly_sales_count,
+        value_fn=attrgetter("monthly_sales_count"),
     ),
     # Featured creations (own)
     Cults3DSensorEntityDescription(
         key=SENSOR_LATEST_CREATION,
         translation_key=SENSOR_LATEST_CREATION,
         icon="mdi:new-box",
-        value_fn=lambda data: data.latest_creation.name,
-        extra_attrs_fn=lambda data: {
-            "url": data.latest_creation.url,
-            "image_url": data.latest_creation.image_url,
-            "views": data.latest_creation.views_count,
-            "downloads": data.latest_creation.downloads_count,
-            "likes": data.latest_creation.likes_count,
-            "published_at": data.latest_creation.published_at.isoformat()
-            if data.latest_creation.published_at
-            else None,
-        },
+        value_fn=attrgetter("latest_creation.name"),
+        extra_attrs_fn=_creation_attrs_fn("latest_creation"),
     ),
     Cults3DSensorEntityDescription(
         key=SENSOR_TOP_DOWNLOADED,
         translation_key=SENSOR_TOP_DOWNLOADED,
         icon="mdi:trending-up",
-        value_fn=lambda data: data.top_downloaded.name,
-        extra_attrs_fn=lambda data: {
-            "url": data.top_downloaded.url,
-            "image_url": data.top_downloaded.image_url,
-            "views": data.top_downloaded.views_count,
-            "downloads": data.top_downloaded.downloads_count,
-            "likes": data.top_downloaded.likes_count,
-            "published_at": data.top_downloaded.published_at.isoformat()
-            if data.top_downloaded.published_at
-            else None,
-        },
+        value_fn=attrgetter("top_downloaded.name"),
+        extra_attrs_fn=_creation_attrs_fn("top_downloaded"),
     ),
 )
 
@@ -145,28 +177,66 @@ async def async_setup_entry(
     entry: Cults3DConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up Cults3D sensor entities based on a config entry."""
-    coordinator = entry.runtime_data
-
-    entities: list[SensorEntity] = []
+    """Set up Cults3D sensor entities based on a config entry.
 
-    # Add standard sensors
-    entities.extend(
-        Cults3DSensor(coordinator, description, entry.entry_id)
+    Deliberately awaitless: entity constructors do no I/O and entities go
+    through a single async_add_entities call, so HA's eager task setup
+    resolves this coroutine synchronously without an event-loop hop.
+    """
+    coordinator = entry.runtime_data
+    entry_id = entry.entry_id
+    username = coordinator.data.username
+
+    # One device_info dict per device, shared by every sensor attached to
+    # it instead of allocating an identical copy per entity
+    device_info = {
+        "identifiers": {(DOMAIN, entry_id)},
+        "name": f"Cults3D ({username})",
+        "manufacturer": "PrintForge",
+        "model": "Cults3D Integration",
+        "entry_type": "service",
+        "configuration_url": f"https://cults3d.com/en/users/{username}",
+    }
+
+    # Standard sensors, specialized by whether the description carries an
+    # attrs builder; tracked-creation sensors are chained on below so
+    # async_add_entities consumes one fused iterator and materializes a
+    # single list
+    entities: Iterable[SensorEntity] = (
+        (
+            Cults3DCreationSensor
+            if description.extra_attrs_fn is not None
+            else Cults3DSensor
+        )(coordinator, description, entry_id, device_info)
         for description in SENSOR_DESCRIPTIONS
     )
 
-    # Add tracked creation sensors
-    for slug, tracked_data in coordinator.data.tracked_creations.items():
-        entities.append(
-            TrackedCreationSensor(coordinator, entry.entry_id, slug, tracked_data)
+    # Tracked creation sensors (separate shared device)
+    if tracked_creations := coordinator.data.tracked_creations:
+        tracked_device_info = {
+            "identifiers": {(DOMAIN, f"{entry_id}_tracked")},
+            "name": "Cults3D Tracked Creations",
+            "manufacturer": "PrintForge",
+            "model": "Cults3D Tracked Creations",
+            "entry_type": "service",
+            "via_device": (DOMAIN, entry_id),
+        }
+        # Sorted so entity creation order is stable across restarts even
+        # if the tracked dict's insertion order changes, avoiding
+        # entity-registry churn
+        entities = chain(
+            entities,
+            (
+                TrackedCreationSensor(coordinator, entry_id, slug, tracked_device_info)
+                for slug in sorted(tracked_creations)
+            ),
         )
 
     async_add_entities(entities)
 
 
 class Cults3DSensor(CoordinatorEntity[Cults3DCoordinator], SensorEntity):
-    """Representation of a Cults3D sensor."""
+    """Representation of a scalar Cults3D sensor (no extra attributes)."""
 
     entity_description: Cults3DSensorEntityDescription
     _attr_has_entity_name = True
@@ -177,31 +247,80 @@ class Cults3DSensor(CoordinatorEntity[Cults3DCoordinator], SensorEntity):
         coordinator: Cults3DCoordinator,
         description: Cults3DSensorEntityDescription,
         entry_id: str,
+        device_info: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry_id)},
-            "name": f"Cults3D ({coordinator.data.username})",
-            "manufacturer": "PrintForge",
-            "model": "Cults3D Integration",
-            "entry_type": "service",
-            "configuration_url": f"https://cults3d.com/en/users/{coordinator.data.username}",
-        }
+        self._attr_device_info = device_info
+        # (value, ..., availability) last written to the state machine;
+        # subclasses may widen the tuple with their own fields
+        self._last_state: tuple[Any, ...] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this sensor's own value changed.
+
+        A poll that only moves other fields (e.g. one tracked creation's
+        downloads) leaves this sensor's state untouched, so the state-
+        machine write is skipped entirely.
+        """
+        state = (
+            self.entity_description.value_fn(self.coordinator.data),
+            self.coordinator.last_update_success,
+        )
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self.async_write_ha_state()
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
         return self.entity_description.value_fn(self.coordinator.data)
 
+
+class Cults3DCreationSensor(Cults3DSensor):
+    """A Cults3D sensor with creation attributes (latest / top downloaded)."""
+
+    def __init__(
+        self,
+        coordinator: Cults3DCoordinator,
+        description: Cults3DSensorEntityDescription,
+        entry_id: str,
+        device_info: dict[str, Any],
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description, entry_id, device_info)
+        # Attribute dict built lazily once per coordinator update; HA may
+        # read extra_state_attributes many times between polls
+        self._cached_attrs: dict[str, Any] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this sensor's value or attrs changed."""
+        data = self.coordinator.data
+        description = self.entity_description
+        state = (
+            description.value_fn(data),
+            description.extra_attrs_fn(data),
+            self.coordinator.last_update_success,
+        )
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self._cached_attrs = state[1]
+        self.async_write_ha_state()
+
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.entity_description.extra_attrs_fn:
-            return self.entity_description.extra_attrs_fn(self.coordinator.data)
-        return None
+        if (attrs := self._cached_attrs) is None:
+            attrs = self._cached_attrs = self.entity_description.extra_attrs_fn(
+                self.coordinator.data
+            )
+        return attrs
 
 
 class TrackedCreationSensor(CoordinatorEntity[Cults3DCoordinator], SensorEntity):
@@ -217,73 +336,69 @@ class TrackedCreationSensor(CoordinatorEntity[Cults3DCoordinator], SensorEntity)
     _attr_has_entity_name = True
     _attr_attribution = ATTRIBUTION
     _attr_icon = "mdi:chart-timeline-variant"
+    _attr_native_unit_of_measurement = "downloads"
 
     def __init__(
         self,
         coordinator: Cults3DCoordinator,
         entry_id: str,
         slug: str,
-        initial_data: TrackedCreationData,
+        device_info: dict[str, Any],
     ) -> None:
         """Initialize the tracked creation sensor."""
         super().__init__(coordinator)
         self._slug = slug
         self._attr_unique_id = f"{entry_id}_tracked_{slug}"
         self._attr_translation_key = "tracked_creation"
-
-        # Use a separate device for tracked creations
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry_id}_tracked")},
-            "name": "Cults3D Tracked Creations",
-            "manufacturer": "PrintForge",
-            "model": "Cults3D Tracked Creations",
-            "entry_type": "service",
-            "via_device": (DOMAIN, entry_id),
-        }
-
-    @property
-    def _tracked_data(self) -> TrackedCreationData | None:
-        """Get the tracked creation data."""
-        return self.coordinator.data.tracked_creations.get(self._slug)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        data = self._tracked_data
-        if data and data.name:
-            return f"Tracked: {data.name}"
-        return f"Tracked: {self._slug}"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the downloads count as the primary metric (proxy for popularity).
-
-        Note: This is downloads count, NOT sales. Sales data for non-owned
-        creations is not available via the Cults3D API.
+        # Separate device for tracked creations, shared across them
+        self._attr_device_info = device_info
+        self._last_success = True
+        self._refresh_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the _attr_* values and write state only on change."""
+        previous = (
+            self._attr_name,
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        )
+        self._refresh_from_data()
+        success = self.coordinator.last_update_success
+        if success == self._last_success and previous == (
+            self._attr_name,
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        ):
+            return
+        self._last_success = success
+        self.async_write_ha_state()
+
+    @callback
+    def _refresh_from_data(self) -> None:
+        """Compute name, state, and attributes from the coordinator data.
+
+        Runs once per coordinator update so HA's frequent state/attribute
+        reads resolve to plain _attr_* lookups instead of rebuilding dicts
+        and re-formatting datetimes per access.
+
+        The state is the downloads count, NOT sales: sales data for
+        non-owned creations is not available via the Cults3D API, and all
+        metrics are cumulative totals rather than 30-day filtered (the API
+        provides no date-filtered statistics; the window info is for
+        reference only).
         """
-        data = self._tracked_data
-        if data:
-            return data.downloads_count
-        return None
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the unit of measurement."""
-        return "downloads"
+        data = self.coordinator.data.tracked_creations.get(self._slug)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes with all available metrics.
-
-        Note: All metrics are cumulative totals, not filtered to 30-day window.
-        The Cults3D API does not provide date-filtered statistics for individual
-        creations. The 30-day window info is provided for reference only.
-        """
-        data = self._tracked_data
         if not data:
-            return {"error": "Creation not found"}
-
-        attrs: dict[str, Any] = {
+            self._attr_name = f"Tracked: {self._slug}"
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = _MISSING_ATTRS
+            return
+
+        self._attr_name = f"Tracked: {data.name or self._slug}"
+        self._attr_native_value = data.downloads_count
+        self._attr_extra_state_attributes = {
             "slug": data.slug,
             "name": data.name,
             "creator": data.creator,
@@ -299,13 +414,5 @@ class TrackedCreationSensor(CoordinatorEntity[Cults3DCoordinator], SensorEntity)
             "window_end": data.window_end.isoformat() if data.window_end else None,
             "is_within_30_day_window": data.is_within_30_days,
             # Documentation
-            "_note": (
-                "Sales data for non-owned creations is NOT available via API. "
-                "Downloads/likes shown are cumulative totals and serve as proxy "
-                "metrics for popularity. The 30-day window indicates the first "
-                "30 days post-release period, but metrics are NOT filtered to "
-                "that window due to API limitations."
-            ),
+            "_note": _TRACKED_NOTE,
         }
-
-        return attrs